@@ -6,12 +6,124 @@ This module provides optimized settings and utilities for deploying
 the Podcast Generator MCP server on Alpic platform.
 """
 
+import functools
+import json
 import os
+import sys
+from importlib.util import find_spec
 from pathlib import Path
-from dotenv import load_dotenv
+from types import MappingProxyType
+from typing import Optional
 
-# Load environment variables
-load_dotenv()
+# Required Environment Variables for Alpic
+REQUIRED_ENV_VARS = frozenset({
+    "OPENROUTER_API_KEY",
+    "SCRIPGENETOR_MODEL",
+})
+
+def __getattr__(name):
+    """Resolve ``alpic_config.load_dotenv`` lazily so dotenv is imported on demand."""
+    if name == "load_dotenv":
+        from dotenv import load_dotenv as _load_dotenv
+        return _load_dotenv
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _apply_env_values(values):
+    """Set parsed .env values without overriding variables already set."""
+    for name, value in values.items():
+        if value is not None:
+            os.environ.setdefault(name, value)
+
+
+def _fast_load_dotenv(env_path=".env"):
+    """
+    Load environment variables, reusing a JSON cache of the parsed .env file.
+
+    The cache is only used when ALPIC_ENV_CACHE=1. It lives in the per-user
+    cache directory ($XDG_CACHE_HOME or ~/.cache, under podcast_generation)
+    and holds API keys, so a cache file is only trusted when it is owned by
+    the current user and not accessible to group or others. It is keyed by
+    the .env path, mtime and size, so any edit to .env triggers a fresh parse.
+    """
+    if os.environ.get("ALPIC_ENV_CACHE") != "1":
+        from dotenv import load_dotenv
+        load_dotenv()
+        return
+
+    try:
+        stat = os.stat(env_path)
+    except OSError:
+        from dotenv import load_dotenv
+        load_dotenv()
+        return
+
+    key = [os.path.abspath(env_path), stat.st_mtime, stat.st_size]
+    cache_root = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    cache_dir = os.path.join(cache_root, "podcast_generation")
+    cache_path = os.path.join(cache_dir, ".env.cache.json")
+
+    try:
+        fd = os.open(cache_path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+        with os.fdopen(fd, encoding="utf-8") as f:
+            cache_stat = os.fstat(f.fileno())
+            if cache_stat.st_uid != os.getuid() or cache_stat.st_mode & 0o077:
+                raise PermissionError(f"untrusted env cache: {cache_path}")
+            cached = json.load(f)
+        if cached.get("key") == key:
+            _apply_env_values(cached["values"])
+            return
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    from dotenv import dotenv_values
+
+    # Cache the file's own contents, not what changed in os.environ: values
+    # already exported in this shell must still reach later clean starts
+    values = dotenv_values(env_path)
+    _apply_env_values(values)
+
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "values": values}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+# Load environment variables, unless the platform already injected them
+if not all(k in os.environ for k in REQUIRED_ENV_VARS):
+    _fast_load_dotenv()
+
+# Snapshot of the environment taken once after dotenv has run; refreshed
+# explicitly through AlpicConfig.refresh_env().
+_ENV_CACHE = dict(os.environ)
+
+def _make_env_validator(required_vars):
+    """
+    Build a validator bound to a fixed set of required variable names.
+    
+    The names are sorted once up front, so the per-call work is a single pass
+    over a tuple against the cached environment snapshot.
+    """
+    names = tuple(sorted(required_vars))
+    
+    def validate_environment(cls):
+        """Validate that required environment variables are set."""
+        env = _ENV_CACHE
+        missing_vars = [var for var in names if not env.get(var)]
+        
+        if missing_vars:
+            raise EnvironmentError(
+                f"Missing required environment variables for Alpic deployment: {missing_vars}"
+            )
+        
+        return True
+    
+    return validate_environment
 
 class AlpicConfig:
     """Configuration class optimized for Alpic deployment."""
@@ -24,17 +136,14 @@ class AlpicConfig:
     TRANSPORT = "streamable-http"
     
     # Required Environment Variables for Alpic
-    REQUIRED_ENV_VARS = [
-        "OPENROUTER_API_KEY",
-        "SCRIPGENETOR_MODEL",
-    ]
+    REQUIRED_ENV_VARS: frozenset = REQUIRED_ENV_VARS
     
     # Optional Environment Variables
-    OPTIONAL_ENV_VARS = [
+    OPTIONAL_ENV_VARS: frozenset = frozenset({
         "ELEVENLABS_API_KEY",
         "OCR_MODEL",
         "OCR_PROVIDER",
-    ]
+    })
     
     # Default TTS Settings for Alpic
     DEFAULT_TTS_ENGINE = "mixed"  # Falls back gracefully
@@ -47,60 +156,96 @@ class AlpicConfig:
     
     # File Management
     MAX_FILE_SIZE_MB = 100  # Maximum output file size
-    TEMP_DIR = os.getenv("TEMP_DIR", "/tmp/podcast_generation")  # Allow override
+    TEMP_DIR = _ENV_CACHE.get("TEMP_DIR", "/tmp/podcast_generation")  # Allow override
+    _temp_dir_cache: Optional[Path] = None  # Set once setup_directories succeeds
     
     @classmethod
-    def validate_environment(cls):
-        """Validate that required environment variables are set."""
-        missing_vars = []
-        
-        for var in cls.REQUIRED_ENV_VARS:
-            if not os.getenv(var):
-                missing_vars.append(var)
-        
-        if missing_vars:
-            raise EnvironmentError(
-                f"Missing required environment variables for Alpic deployment: {missing_vars}"
-            )
-        
-        return True
+    def refresh_env(cls):
+        """Re-snapshot os.environ into the cached environment."""
+        global _ENV_CACHE
+        _ENV_CACHE = dict(os.environ)
+        cls.TEMP_DIR = _ENV_CACHE.get("TEMP_DIR", "/tmp/podcast_generation")
+        return _ENV_CACHE
     
-    @classmethod
-    def get_server_config(cls):
-        """Get server configuration dictionary."""
-        return {
-            "name": cls.SERVER_NAME,
-            "port": cls.SERVER_PORT,
-            "stateless_http": cls.STATELESS_HTTP,
-            "debug": cls.DEBUG_MODE,
-            "transport": cls.TRANSPORT,
-        }
+    # Specialised for REQUIRED_ENV_VARS once, when the class is defined
+    validate_environment = classmethod(_make_env_validator(REQUIRED_ENV_VARS))
     
-    @classmethod
-    def get_tts_config(cls):
-        """Get TTS configuration optimized for Alpic."""
-        return {
-            "tts_engine": cls.DEFAULT_TTS_ENGINE,
-            "headline_voice": cls.HEADLINE_VOICE_ID,
-            "text_voice": cls.TEXT_VOICE_ID,
-            "sample_rate": cls.DEFAULT_SAMPLE_RATE,
-            "output_format": cls.DEFAULT_OUTPUT_FORMAT,
-            "silence_duration": 0.5,
-            "headline_silence": 1.0,
-            "normalize_audio": True,
-        }
+    @staticmethod
+    def get_server_config():
+        """Get server configuration dictionary (read-only view)."""
+        return _SERVER_CONFIG
+    
+    @staticmethod
+    def get_tts_config():
+        """Get TTS configuration optimized for Alpic (read-only view)."""
+        return _TTS_CONFIG
     
     @classmethod
     def setup_directories(cls):
-        """Create necessary directories for Alpic deployment."""
+        """Create necessary directories for Alpic deployment (once per TEMP_DIR)."""
+        cached = cls._temp_dir_cache
+        if cached is not None and str(cached) == cls.TEMP_DIR:
+            return cached
+        
+        if not os.path.isdir(cls.TEMP_DIR):
+            os.makedirs(cls.TEMP_DIR, exist_ok=True)
         temp_dir = Path(cls.TEMP_DIR)
-        temp_dir.mkdir(parents=True, exist_ok=True)
+        cls._temp_dir_cache = temp_dir
         return temp_dir
 
-def check_alpic_readiness():
+# Built once at import; exposed read-only so callers can't mutate shared state.
+# Keys are source literals, which the compiler already interns, so lookups from
+# call sites using the same literals hit CPython's identity fast path.
+_SERVER_CONFIG = MappingProxyType({
+    "name": AlpicConfig.SERVER_NAME,
+    "port": AlpicConfig.SERVER_PORT,
+    "stateless_http": AlpicConfig.STATELESS_HTTP,
+    "debug": AlpicConfig.DEBUG_MODE,
+    "transport": AlpicConfig.TRANSPORT,
+})
+
+_TTS_CONFIG = MappingProxyType({
+    "tts_engine": AlpicConfig.DEFAULT_TTS_ENGINE,
+    "headline_voice": AlpicConfig.HEADLINE_VOICE_ID,
+    "text_voice": AlpicConfig.TEXT_VOICE_ID,
+    "sample_rate": AlpicConfig.DEFAULT_SAMPLE_RATE,
+    "output_format": AlpicConfig.DEFAULT_OUTPUT_FORMAT,
+    "silence_duration": 0.5,
+    "headline_silence": 1.0,
+    "normalize_audio": True,
+})
+
+def _report(emoji, ascii_marker, message):
+    """
+    Write one status message to stdout in a single call.
+    
+    Emoji markers are only used on a TTY; pipes and container logs get plain
+    ASCII. Nothing is written when ALPIC_QUIET is set.
+    """
+    if os.environ.get("ALPIC_QUIET"):
+        return
+    marker = emoji if sys.stdout.isatty() else ascii_marker
+    sys.stdout.write(f"{marker} {message}\n")
+
+def _report_readiness(ok, message):
+    """Write a single readiness status line to stdout."""
+    if ok:
+        _report("✅", "[OK]", message)
+    else:
+        _report("❌", "[FAIL]", message)
+
+@functools.lru_cache(maxsize=2)
+def check_alpic_readiness(deep_check=False):
     """
     Check if the environment is ready for Alpic deployment.
     
+    The result is cached for the process lifetime; use reload_alpic_env()
+    to re-run the check after changing the environment.
+    
+    Args:
+        deep_check: Actually import each required module instead of only
+            locating it with importlib.util.find_spec
+    
     Returns:
         bool: True if ready, False otherwise
     """
@@ -119,43 +264,56 @@ def check_alpic_readiness():
         ]
         
         for module in required_modules:
-            try:
-                __import__(module)
-            except ImportError as e:
-                print(f"❌ Missing module: {module}")
+            if deep_check:
+                try:
+                    __import__(module)
+                except ImportError:
+                    _report_readiness(False, f"Missing module: {module}")
+                    return False
+            elif find_spec(module) is None:
+                _report_readiness(False, f"Missing module: {module}")
                 return False
         
         # Setup directories
         AlpicConfig.setup_directories()
         
-        print("✅ Environment is ready for Alpic deployment!")
+        _report_readiness(True, "Environment is ready for Alpic deployment!")
         return True
         
     except Exception as e:
-        print(f"❌ Alpic readiness check failed: {e}")
+        _report_readiness(False, f"Alpic readiness check failed: {e}")
         return False
 
+def reload_alpic_env():
+    """Re-snapshot the environment and drop the cached readiness result."""
+    AlpicConfig.refresh_env()
+    check_alpic_readiness.cache_clear()
+
 def get_alpic_optimized_config():
     """
     Get configuration optimized for Alpic platform.
     
+    The server and TTS sections are copied from the read-only views built
+    at import, so the result is a plain, JSON-serializable dict the caller
+    is free to modify.
+    
     Returns:
         dict: Configuration dictionary
     """
     return {
-        "server": AlpicConfig.get_server_config(),
-        "tts": AlpicConfig.get_tts_config(),
+        "server": dict(_SERVER_CONFIG),
+        "tts": dict(_TTS_CONFIG),
         "temp_dir": str(AlpicConfig.setup_directories()),
         "max_file_size_mb": AlpicConfig.MAX_FILE_SIZE_MB,
     }
 
 if __name__ == "__main__":
     # Quick readiness check
-    print("🚀 Checking Alpic deployment readiness...")
-    if check_alpic_readiness():
+    _report("🚀", "[INFO]", "Checking Alpic deployment readiness...")
+    if check_alpic_readiness(deep_check="--deep-check" in sys.argv[1:]):
         config = get_alpic_optimized_config()
-        print("📋 Alpic Configuration:")
-        for key, value in config.items():
-            print(f"  {key}: {value}")
+        lines = ["Alpic Configuration:"]
+        lines.extend(f"  {key}: {value}" for key, value in config.items())
+        _report("📋", "[INFO]", "\n".join(lines))
     else:
-        print("⚠️  Please fix the issues above before deploying to Alpic.")
\ No newline at end of file
+        _report("⚠️ ", "[WARN]", "Please fix the issues above before deploying to Alpic.")
@@ -0,0 +1,18 @@
+"""
+Shared pytest fixtures for the MCP server test scripts.
+"""
+
+import importlib
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def mcp_module():
+    """
+    Import the MCP server module once for the whole session.
+
+    An import failure is a deployment failure, so it errors the tests that
+    need the server instead of skipping them.
+    """
+    return importlib.import_module("main")
@@ -7,15 +7,43 @@ This script demonstrates how to:
 2. Convert the script to audio using generate_podcast.py
 """
 
-import asyncio
 from pathlib import Path
 
-# Import our modules
-from generate_script import process_script, _fetch_paper_html
-from generate_podcast import generate_podcast_from_script, PodcastConfig, PodcastGenerator
+# Sample script in the expected format
+_SAMPLE_SCRIPT = """\\Headline: Welcome to today's research paper review
+\\Text: Hello everyone, and welcome back to our channel! Today we're diving into an exciting paper about transformer architectures.
+\\Headline: Let's explore the key innovations presented in this work  
+\\Text: The paper introduces several breakthrough concepts that have revolutionized natural language processing. We'll break down each component step by step.
+\\Text: First, let's understand the attention mechanism, which allows the model to focus on different parts of the input sequence simultaneously.
+\\Headline: Now we'll examine the experimental results
+\\Text: The authors conducted extensive experiments across multiple datasets, demonstrating significant improvements over previous approaches.
+\\Text: Thank you for watching today's review. Don't forget to subscribe for more research paper breakdowns!"""
+
+# PodcastConfig options for the full pipeline; passed straight through so
+# generate_podcast_from_script builds the only PodcastConfig instance
+_FULL_PIPELINE_KWARGS = {
+    "tts_engine": "mixed",        # Use both engines
+    "sample_rate": 24000,
+    "headline_voice": "narrator",
+    "text_voice": "host",
+    "silence_duration": 0.8,      # Longer pauses for clarity
+    "headline_silence": 1.5,      # Even longer after headlines
+    "normalize_audio": True,
+}
+
+# PodcastConfig options for the sample conversion
+_SAMPLE_KWARGS = {
+    "tts_engine": "mixed",
+    "sample_rate": 22050,
+    "silence_duration": 0.5,
+    "headline_silence": 1.0,
+}
 
-async def example_full_pipeline():
+def example_full_pipeline():
     """Example of complete pipeline: Paper -> Script -> Podcast"""
+    # Imported lazily so --help and sample mode skip the LLM/TTS stacks
+    from generate_script import process_script, _fetch_paper_html
+    from generate_podcast import generate_podcast_from_script
     
     print("🚀 Starting ArXiv Paper to Podcast Pipeline...")
     
@@ -44,8 +72,7 @@ async def example_full_pipeline():
         
         # Save script to file for inspection
         script_path = f"script_{paper_id}.txt"
-        with open(script_path, 'w', encoding='utf-8') as f:
-            f.write(script_text)
+        Path(script_path).write_text(script_text, encoding='utf-8')
         print(f"💾 Script saved to: {script_path}")
         
     except Exception as e:
@@ -55,22 +82,11 @@ async def example_full_pipeline():
     # Step 3: Generate podcast
     print("\n🎙️ Step 3: Generating podcast...")
     try:
-        # Configure podcast generation
-        config = PodcastConfig(
-            tts_engine="mixed",        # Use both engines  
-            sample_rate=24000,
-            headline_voice="narrator", 
-            text_voice="host",
-            silence_duration=0.8,     # Longer pauses for clarity
-            headline_silence=1.5,     # Even longer after headlines
-            normalize_audio=True
-        )
-        
-        # Generate podcast using async generator directly
-        generator = PodcastGenerator(config)
-        podcast_path = await generator.generate_podcast(
+        # Only the TTS step is async; the helper runs its own event loop
+        podcast_path = generate_podcast_from_script(
             script_text=script_text,
-            output_path=f"podcast_{paper_id}.wav"
+            output_path=f"podcast_{paper_id}.wav",
+            **_FULL_PIPELINE_KWARGS
         )
         
         print(f"🎉 Podcast generated successfully!")
@@ -86,28 +102,16 @@ async def example_full_pipeline():
 
 def example_script_to_podcast():
     """Example with a sample script (no API calls needed)"""
+    from generate_podcast import generate_podcast_from_script
     
     print("🎙️ Testing Script to Podcast Conversion...")
     
-    # Sample script in the expected format
-    sample_script = """\\Headline: Welcome to today's research paper review
-\\Text: Hello everyone, and welcome back to our channel! Today we're diving into an exciting paper about transformer architectures.
-\\Headline: Let's explore the key innovations presented in this work  
-\\Text: The paper introduces several breakthrough concepts that have revolutionized natural language processing. We'll break down each component step by step.
-\\Text: First, let's understand the attention mechanism, which allows the model to focus on different parts of the input sequence simultaneously.
-\\Headline: Now we'll examine the experimental results
-\\Text: The authors conducted extensive experiments across multiple datasets, demonstrating significant improvements over previous approaches.
-\\Text: Thank you for watching today's review. Don't forget to subscribe for more research paper breakdowns!"""
-    
     try:
         # Generate podcast with sample script
         podcast_path = generate_podcast_from_script(
-            script_text=sample_script,
+            script_text=_SAMPLE_SCRIPT,
             output_path="sample_podcast.wav",
-            tts_engine="mixed",
-            sample_rate=22050,
-            silence_duration=0.5,
-            headline_silence=1.0
+            **_SAMPLE_KWARGS
         )
         
         print(f"✅ Sample podcast generated: {podcast_path}")
@@ -117,6 +121,12 @@ def example_script_to_podcast():
 
 def main():
     """Main entry point with options."""
+    import sys
+    
+    # Default mode needs no parsing; keep argparse out of the common path
+    if len(sys.argv) == 1:
+        return example_script_to_podcast()
+    
     import argparse
     
     parser = argparse.ArgumentParser(description="Example podcast generation")
@@ -126,7 +136,7 @@ def main():
     args = parser.parse_args()
     
     if args.mode == "full":
-        asyncio.run(example_full_pipeline())
+        example_full_pipeline()
     else:
         example_script_to_podcast()
 
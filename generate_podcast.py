@@ -10,12 +10,13 @@ Usage:
 """
 
 import asyncio
+import inspect
 import os
 import re
 import tempfile
 import logging
 from pathlib import Path
-from typing import List, Tuple, Optional, Literal
+from typing import Awaitable, Callable, List, Tuple, Optional, Literal, Union
 from dataclasses import dataclass
 import argparse
 
@@ -64,6 +65,48 @@ class AudioSegment:
     duration: float
     voice_used: str
 
+# Signature of an injectable TTS backend, see PodcastConfig.tts_fn
+TTSFunction = Callable[
+    [str, str], Union[Tuple[np.ndarray, int], Awaitable[Tuple[np.ndarray, int]]]
+]
+
+
+def _synthesize_mock_audio(text: str, sample_rate: int) -> np.ndarray:
+    """Synthesize a placeholder tone whose length follows the text length."""
+    # Estimate duration based on text length (average reading speed)
+    words = len(text.split())
+    duration = max(1.0, words * 0.4)  # ~2.5 words per second
+    
+    samples = int(duration * sample_rate)
+    t = np.linspace(0, duration, samples, False)
+    
+    # Create a pleasant tone (440Hz with some harmonics)
+    frequency = 440.0  # A4 note
+    audio = (np.sin(2 * np.pi * frequency * t) * 0.3 + 
+            np.sin(2 * np.pi * frequency * 2 * t) * 0.1 + 
+            np.sin(2 * np.pi * frequency * 3 * t) * 0.05)
+    
+    # Apply envelope to avoid clicks
+    envelope_length = int(0.1 * sample_rate)  # 100ms fade in/out
+    if len(audio) > 2 * envelope_length:
+        fade_in = np.linspace(0, 1, envelope_length)
+        fade_out = np.linspace(1, 0, envelope_length)
+        audio[:envelope_length] *= fade_in
+        audio[-envelope_length:] *= fade_out
+    
+    logger.debug(f"🎵 Generated {duration:.2f}s mock audio for: {text[:30]}...")
+    return audio
+
+
+def mock_tts(text: str, voice: str = "mock", sample_rate: int = 24000) -> Tuple[np.ndarray, int]:
+    """Mock TTS backend for ``PodcastConfig.tts_fn``; ignores the voice.
+
+    Bind ``sample_rate`` to the config's rate with ``functools.partial`` so
+    segments need no resampling.
+    """
+    return _synthesize_mock_audio(text, sample_rate), sample_rate
+
+
 @dataclass 
 class PodcastConfig:
     """Configuration for podcast generation."""
@@ -87,6 +130,10 @@ class PodcastConfig:
     # Output settings
     normalize_audio: bool = True
     output_format: str = "wav"       # wav, mp3, etc.
+    
+    # Pre-resolved TTS callable ``(text, voice) -> (audio, sample_rate)``,
+    # sync or async; when set it bypasses the engine dispatch entirely
+    tts_fn: Optional[TTSFunction] = None
 
 
 class PodcastGenerator:
@@ -301,8 +348,10 @@ class PodcastGenerator:
         Returns:
             AudioSegment with generated audio
         """
-        # Ensure TTS engines are initialized
-        self._ensure_tts_initialized()
+        # Ensure TTS engines are initialized unless a backend was injected
+        tts_fn = self.config.tts_fn
+        if tts_fn is None:
+            self._ensure_tts_initialized()
         
         # Select voice and TTS engine based on component type
         if component_type == "Headline":
@@ -317,33 +366,42 @@ class PodcastGenerator:
         voice_used = None
         
         try:
-            if self.config.tts_engine == "mixed":
-                engine = prefer_engine
+            if tts_fn is not None:
+                # Injected backend: no engine initialization or dispatch
+                result = tts_fn(text, voice)
+                if inspect.isawaitable(result):
+                    result = await result
+                audio_data, sample_rate = result
+                is_mock = getattr(tts_fn, "func", tts_fn) is mock_tts
+                voice_used = "Mock-TTS" if is_mock else f"Custom-{voice}"
             else:
-                engine = self.config.tts_engine
+                if self.config.tts_engine == "mixed":
+                    engine = prefer_engine
+                else:
+                    engine = self.config.tts_engine
                 
-            if engine == "mock":
-                # Force mock audio generation
-                audio_data, sample_rate = self._generate_mock_audio(text)
-                voice_used = "Mock-TTS"
-            elif engine == "elevenlabs" and self.elevenlabs:
-                audio_data, sample_rate = await self.generate_audio_elevenlabs(text, voice)
-                voice_used = f"ElevenLabs-{voice}"
-            elif engine == "kokoro" and self.kokoro_pipeline:
-                audio_data, sample_rate = await self.generate_audio_kokoro(text, voice)
-                voice_used = f"Kokoro-{voice}"
-            else:
-                # Fallback
-                if self.kokoro_pipeline:
-                    audio_data, sample_rate = await self.generate_audio_kokoro(text, voice)
-                    voice_used = f"Kokoro-{voice}"
-                elif self.elevenlabs:
+                if engine == "mock":
+                    # Force mock audio generation
+                    audio_data, sample_rate = self._generate_mock_audio(text)
+                    voice_used = "Mock-TTS"
+                elif engine == "elevenlabs" and self.elevenlabs:
                     audio_data, sample_rate = await self.generate_audio_elevenlabs(text, voice)
                     voice_used = f"ElevenLabs-{voice}"
+                elif engine == "kokoro" and self.kokoro_pipeline:
+                    audio_data, sample_rate = await self.generate_audio_kokoro(text, voice)
+                    voice_used = f"Kokoro-{voice}"
                 else:
-                    # Last resort: generate mock audio for testing
-                    audio_data, sample_rate = self._generate_mock_audio(text)
-                    voice_used = "Mock-TTS"
+                    # Fallback
+                    if self.kokoro_pipeline:
+                        audio_data, sample_rate = await self.generate_audio_kokoro(text, voice)
+                        voice_used = f"Kokoro-{voice}"
+                    elif self.elevenlabs:
+                        audio_data, sample_rate = await self.generate_audio_elevenlabs(text, voice)
+                        voice_used = f"ElevenLabs-{voice}"
+                    else:
+                        # Last resort: generate mock audio for testing
+                        audio_data, sample_rate = self._generate_mock_audio(text)
+                        voice_used = "Mock-TTS"
         
         except Exception as e:
             logger.error(f"❌ Failed to generate audio for: {text[:50]}...")
@@ -389,33 +447,10 @@ class PodcastGenerator:
 
     def _generate_mock_audio(self, text: str) -> Tuple[np.ndarray, int]:
         """Generate mock audio for testing when no TTS engines are available."""
-        # Estimate duration based on text length (average reading speed)
-        words = len(text.split())
-        duration = max(1.0, words * 0.4)  # ~2.5 words per second
-        
-        # Generate a simple sine wave tone
         sample_rate = getattr(self.config, 'sample_rate', 24000)
         if hasattr(sample_rate, 'default'):
             sample_rate = sample_rate.default
-        samples = int(duration * sample_rate)
-        t = np.linspace(0, duration, samples, False)
-        
-        # Create a pleasant tone (440Hz with some harmonics)
-        frequency = 440.0  # A4 note
-        audio = (np.sin(2 * np.pi * frequency * t) * 0.3 + 
-                np.sin(2 * np.pi * frequency * 2 * t) * 0.1 + 
-                np.sin(2 * np.pi * frequency * 3 * t) * 0.05)
-        
-        # Apply envelope to avoid clicks
-        envelope_length = int(0.1 * sample_rate)  # 100ms fade in/out
-        if len(audio) > 2 * envelope_length:
-            fade_in = np.linspace(0, 1, envelope_length)
-            fade_out = np.linspace(1, 0, envelope_length)
-            audio[:envelope_length] *= fade_in
-            audio[-envelope_length:] *= fade_out
-        
-        logger.debug(f"🎵 Generated {duration:.2f}s mock audio for: {text[:30]}...")
-        return audio, sample_rate
+        return _synthesize_mock_audio(text, sample_rate), sample_rate
 
     async def generate_podcast(self, script_text: str, output_path: str = None) -> str:
         """
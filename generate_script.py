@@ -4,29 +4,48 @@ from typing import Literal, Any, List
 import instructor
 from instructor.core.hooks import Hooks, HookName
 import requests
+import asyncio
+import functools
+import hashlib
 import os
+import sys
 import logging
-import traceback
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 from enum import Enum
+from operator import attrgetter
+from contextvars import ContextVar
 
 
 logger = logging.getLogger(__name__)
 
 
-# Load environment variables from .env file
-load_dotenv()
-
-# Access the variables
-OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
-OCR_MODEL = os.getenv("OCR_MODEL")
-OCR_PROVIDER = os.getenv("OCR_PROVIDER")
-OCR_COORDINATE_EXTRACTOR_MODEL = os.getenv("OCR_COORDINATE_EXTRACTOR_MODEL")
-OCR_PARSING_MODEL = os.getenv("OCR_PARSING_MODEL")
-OCR_FIGURE_DETECTOR_MODEL = os.getenv("OCR_FIGURE_DETECTOR_MODEL")
-SCRIPGENETOR_MODEL = os.getenv("SCRIPGENETOR_MODEL")
-GEMINI_SCRIP_MODEL = os.getenv("GEMINI_SCRIP_MODEL")
+@dataclass(frozen=True, slots=True)
+class ScriptGeneratorConfig:
+    """Environment-derived settings for script generation."""
+    openrouter_api_key: str | None
+    model: str
+    streaming: bool
+    script_cache_dir: str | None
+    script_cache_size: int
+
+
+@functools.cache
+def _cfg() -> ScriptGeneratorConfig:
+    """Load .env and read the environment once; call _cfg.cache_clear() to reload."""
+    load_dotenv()
+    return ScriptGeneratorConfig(
+        openrouter_api_key=os.getenv("OPENROUTER_API_KEY"),
+        model=os.getenv("SCRIPGENETOR_MODEL", "qwen/qwen3-235b-a22b-thinking-2507"),
+        streaming=os.getenv("SCRIPT_STREAMING") == "1",
+        script_cache_dir=os.getenv("SCRIPT_CACHE_DIR") or None,
+        # A negative size would make eviction pop from an empty cache
+        script_cache_size=max(0, int(os.getenv("SCRIPT_CACHE_SIZE", "64"))),
+    )
 
 import re
 
@@ -36,6 +55,12 @@ class ScriptComponentType(str, Enum):
     HEADLINE = "Headline"
 
 
+# Plain-string views of ScriptComponentType for the hot validation loops
+_HEADLINE = ScriptComponentType.HEADLINE.value
+_TEXT = ScriptComponentType.TEXT.value
+_VALID_COMPONENT_TYPES = frozenset({_TEXT, _HEADLINE})
+
+
 class ScriptComponent(BaseModel):
     component_type: str = Field(
         ...,
@@ -53,6 +78,19 @@ class ScriptComponent(BaseModel):
         description="Position of the component in the script"
     )
 
+    @field_validator('component_type')
+    @classmethod
+    def strip_component_type(cls, value: str) -> str:
+        # Normalise once here so formatting and validation can skip .strip();
+        # interning collapses the handful of distinct types to shared objects
+        return sys.intern(value.strip())
+
+
+# One "\Type: content" line per component, as parsed by generate_podcast.py
+_SCRIPT_LINE_FORMAT = "\\%s: %s"
+_TYPE_AND_CONTENT = attrgetter("component_type", "content")
+_POSITION = attrgetter("position")
+
 
 def reconstruct_script(script: BaseModel) -> str:
     """
@@ -78,105 +116,112 @@ def reconstruct_script(script: BaseModel) -> str:
         \\Headline: Understanding GPT-4
         \\Text: Welcome to this review!
     """
-    return '\n'.join(f"\\{comp.component_type.strip()}: {comp.content}" 
-                    for comp in script.components)
-
-
-def generate_model_with_context_check(paper_id : str ,paper_content : str):
-    class ArxflixScript(BaseModel):
-        title: str = Field(
-            ...,
-            description="Title of the research paper",
-            examples=[
-                "Uni-MoE: Scaling Unified Multimodal LLMs with Mixture of Experts",
-                "Attention Is All You Need",
-                "BERT: Pre-training of Deep Bidirectional Transformers"
-            ]
-        )
-        paper_id: str = Field(
-            ...,
-            description=f"ArXiv paper ID (e.g., '2405.11273')",
-            examples=["2405.11273", "1706.03762", "1810.04805"]
-        )
-        target_duration_minutes: float = Field(
-            ...,
-            ge=0,
-            le=6,
-            description="Target video duration in minutes",
-            examples=[5.0, 5.5, 6.0]
-        )
-        components: List[ScriptComponent] = Field(
-            ...,
-            description="List of script components",
-            examples=[[
-                {
-                    "component_type": "Headline",
-                    "content": "Let's explore how GPT-4 revolutionizes language modeling with advanced techniques",
-                    "position": 0
-                },
-                {
-                    "component_type": "Text",
-                    "content": "Today we're diving deep into the revolutionary GPT-4 model and understanding what makes it so powerful.",
-                    "position": 1
-                },
-
-            ]]
-        )
+    # Read the validated field straight from the instance dict; no pydantic
+    # attribute machinery is needed to format already-validated data
+    return '\n'.join([_SCRIPT_LINE_FORMAT % _TYPE_AND_CONTENT(comp)
+                      for comp in script.__dict__["components"]])
 
-        @model_validator(mode='after')
-        def validate_script_structure(cls,values):
-            errors = []
-            logger.warning(f"Validating script structure for paper_id: {paper_id}")
 
-            components = values.components
+# Paper id the model output is checked against; "paper_id" disables the check
+_EXPECTED_PAPER_ID: ContextVar[str] = ContextVar("expected_paper_id", default="paper_id")
 
-            
 
-            if not components:
-                errors.append(ValueError("Script must contain at least one component"))
+class ArxflixScript(BaseModel):
+    title: str = Field(
+        ...,
+        description="Title of the research paper",
+        examples=[
+            "Uni-MoE: Scaling Unified Multimodal LLMs with Mixture of Experts",
+            "Attention Is All You Need",
+            "BERT: Pre-training of Deep Bidirectional Transformers"
+        ]
+    )
+    paper_id: str = Field(
+        ...,
+        description=f"ArXiv paper ID (e.g., '2405.11273')",
+        examples=["2405.11273", "1706.03762", "1810.04805"]
+    )
+    target_duration_minutes: float = Field(
+        ...,
+        ge=0,
+        le=6,
+        description="Target video duration in minutes",
+        examples=[5.0, 5.5, 6.0]
+    )
+    components: List[ScriptComponent] = Field(
+        ...,
+        description="List of script components",
+        examples=[[
+            {
+                "component_type": "Headline",
+                "content": "Let's explore how GPT-4 revolutionizes language modeling with advanced techniques",
+                "position": 0
+            },
+            {
+                "component_type": "Text",
+                "content": "Today we're diving deep into the revolutionary GPT-4 model and understanding what makes it so powerful.",
+                "position": 1
+            },
+
+        ]]
+    )
+
+    @model_validator(mode='after')
+    def validate_script_structure(cls,values):
+        errors: list[str] = []
+        paper_id = _EXPECTED_PAPER_ID.get()
+        logger.warning(f"Validating script structure for paper_id: {paper_id}")
 
-            if paper_id != "paper_id" and values.paper_id != paper_id:
-                logger.warning(f"Paper ID mismatch: expected {paper_id}, got {values.paper_id}, correcting")
-                errors.append(ValueError(f"The paper id is {paper_id}, you wrote a wrong one, correct it everywhere"))
-                
-            else:
-                sorted_components = sorted(components, key=lambda x: x.position)
-                
-                positions = [comp.position for comp in sorted_components]
-                if positions != list(range(len(positions))):
-                    errors.append(ValueError("Component positions must be consecutive integers starting from 0"))
+        components = values.components
 
-                if sorted_components[0].component_type.strip() != ScriptComponentType.HEADLINE:
-                    errors.append(ValueError("Script must start with a Headline component"))
-                
-                for i in range(1, len(sorted_components)):
-                    if (sorted_components[i].component_type.strip() == sorted_components[i-1].component_type.strip() and 
-                        sorted_components[i].component_type.strip() != ScriptComponentType.TEXT):
-                        errors.append(ValueError(f"Consecutive {sorted_components[i].component_type.strip()} components are not allowed"))
+        
+
+        if not components:
+            errors.append("Script must contain at least one component")
 
-                values.components = sorted_components
+        if paper_id != "paper_id" and values.paper_id != paper_id:
+            logger.warning(f"Paper ID mismatch: expected {paper_id}, got {values.paper_id}, correcting")
+            errors.append(f"The paper id is {paper_id}, you wrote a wrong one, correct it everywhere")
             
+        else:
+            sorted_components = sorted(components, key=_POSITION)
+            
+            if not all(comp.position == i for i, comp in enumerate(sorted_components)):
+                errors.append("Component positions must be consecutive integers starting from 0")
 
-            for comp in values.components:
-                # if comp.component_type.strip() == ScriptComponentType.FIGURE:
-                #     # More lenient figure validation - only check if it looks like a URL
-                #     if not (comp.content.startswith('http') or comp.content.startswith('/')): 
-                #         errors.append(ValueError(f"Figure content should be a valid URL or file path: {comp.content}"))
-                #     # Skip figure link accessibility check for now to avoid network issues
-                    
-                if comp.component_type.strip() not in ["Text",  "Headline"]:
-                    errors.append(ValueError(f"""{comp.component_type.strip()} is not a valid component_type.
-                             Type of autorized script component
-                                    Only one of : 
-                                    - Text 
-                                    - Headline"""))
-                    logger.info(errors[-1])
-            if errors:
-                print(errors)
-                logger.info(errors)
-                raise ValueError(errors)
-            return values
-    return ArxflixScript
+            # component_type is stripped by ScriptComponent's field validator
+            component_types = [comp.component_type for comp in sorted_components]
+
+            if component_types[0] != _HEADLINE:
+                errors.append("Script must start with a Headline component")
+            
+            for i in range(1, len(component_types)):
+                if (component_types[i] == component_types[i-1] and 
+                    component_types[i] != _TEXT):
+                    errors.append(f"Consecutive {component_types[i]} components are not allowed")
+
+            values.components = sorted_components
+        
+
+        for comp in values.components:
+            # if comp.component_type.strip() == ScriptComponentType.FIGURE:
+            #     # More lenient figure validation - only check if it looks like a URL
+            #     if not (comp.content.startswith('http') or comp.content.startswith('/')): 
+            #         errors.append(f"Figure content should be a valid URL or file path: {comp.content}")
+            #     # Skip figure link accessibility check for now to avoid network issues
+                
+            if comp.component_type not in _VALID_COMPONENT_TYPES:
+                errors.append(f"""{comp.component_type} is not a valid component_type.
+                         Type of autorized script component
+                                Only one of : 
+                                - Text 
+                                - Headline""")
+        if errors:
+            logger.warning("Script validation failed: %d errors", len(errors))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("errors=%s", errors)
+            raise ValueError("; ".join(errors))
+        return values
 
 
 
@@ -217,41 +262,46 @@ def replace_keys_with_values(text, dict_list):
 
   return modified_text
 
+_AR5IV_HOST = 'ar5iv.labs.arxiv.org'
+
 def adjust_links(text_md : str, paper_id : str):
 
-    def get_link(link, paper_id):
+    # Per-document prefixes, built once instead of on every line
+    html_prefix = f'https://arxiv.org/html/{paper_id}/'
+    malformed_html_prefix = f'https:/arxiv.org/html/{paper_id}/'
+    bare_arxiv_prefix = f'https://arxiv.org/html/{paper_id}'
+
+    def get_link(link):
         # Handle empty or invalid links
         if not link or not link.strip():
             return link
-            
-        if 'ar5iv.labs.arxiv.org' in link:
-            return '![]('+link.replace('![](','https://').replace(')','')+')'
-        elif f'https:/arxiv.org/html/{paper_id}/'  in link:
-            return '![]('+link.replace('![](',f'https://arxiv.org/html/{paper_id}/').replace(')','')+')'
+
+        # Pick the (text to replace, replacement) pair; first matching rule wins
+        if _AR5IV_HOST in link:
+            old, new = '![](', 'https://'
+        elif malformed_html_prefix in link:
+            old, new = '![](', html_prefix
         elif '(arxiv.org' in link:
-            return '![]('+link.replace('![](arxiv.org',f'https://arxiv.org/html/{paper_id}').replace(')','')+')'
+            old, new = '![](arxiv.org', bare_arxiv_prefix
         else:
-            return '![]('+link.replace('![](',f'https://arxiv.org/html/{paper_id}/').replace(')','')+')'
-
-    # Filter out empty lines and only process valid image links
-    lines_with_images = [line for line in text_md.split('\n') if line.strip() and '![](' in line]
-    
-    # Create dictionaries only for valid lines
-    links = []
-    for line in lines_with_images:
-        try:
-            processed_link = get_link(line, paper_id)
-            # Only add to links if both original and processed are valid
-            if line.strip() and processed_link.strip() and line != processed_link:
-                links.append({line: processed_link})
-        except Exception as e:
-            # Log the error but continue processing
-            print(f"Warning: Error processing link '{line}': {e}")
-            continue
+            old, new = '![](', html_prefix
+        return '![](' + link.replace(old, new).replace(')', '') + ')'
 
-    output = replace_keys_with_values(text_md, links)
+    # Rewrite image lines in place in a single pass over the document
+    output_lines = []
+    for line in text_md.split('\n'):
+        if '![](' in line and line.strip():
+            try:
+                processed_link = get_link(line)
+                # Only substitute when the processed link is valid
+                if processed_link.strip():
+                    line = processed_link
+            except Exception as e:
+                # Log the error but continue processing
+                print(f"Warning: Error processing link '{line}': {e}")
+        output_lines.append(line)
 
-    return output
+    return '\n'.join(output_lines)
 
 SYSTEM_PROMPT = r"""
 <context>
@@ -538,6 +588,33 @@ def create_logging_hooks(tag: str = "instructor") -> Hooks:
     return hooks
 
 
+_FIGURE_CHECK_WORKERS = 16
+_FIGURE_CHECK_TIMEOUT = 10  # seconds per HEAD request
+
+
+def _is_png(response) -> bool:
+    return response.status_code == 200 and "image/png" in response.headers.get(
+        "Content-Type", ""
+    )
+
+
+def _resolve_figure_url(session: requests.Session, figure_url: str) -> str | None:
+    """Return a reachable PNG URL for a figure, or None to leave the line as is."""
+    try:
+        # Check if the URL leads to an image (PNG)
+        if _is_png(session.head(figure_url, timeout=_FIGURE_CHECK_TIMEOUT)):
+            return figure_url
+
+        # Remove "ar5iv.labs." and try again
+        figure_url = figure_url.replace("ar5iv.labs.", "")
+        if _is_png(session.head(figure_url, timeout=_FIGURE_CHECK_TIMEOUT)):
+            return figure_url
+    except requests.exceptions.RequestException:
+        # If the request fails, leave the link as is
+        pass
+    return None
+
+
 def _correct_result_link(script: str, url: str) -> str:
     """Correct generated links in a research paper script.
 
@@ -562,6 +639,8 @@ def _correct_result_link(script: str, url: str) -> str:
 
     split_script = script.split("n")
 
+    # Build every candidate figure URL first so the HEAD checks can overlap
+    candidates = []
     for line_idx, line in enumerate(split_script):
         if r"Figure: " in line and not line.startswith("https"):
             tmp_line = line.replace(r"Figure: ", "")
@@ -573,65 +652,104 @@ def _correct_result_link(script: str, url: str) -> str:
             else:
                 figure_url = f"{url if url.endswith('/') else url+'/'}{tmp_line if tmp_line[0] != '/' else tmp_line[1:]}"
 
-            try:
-                # Check if the URL leads to an image (PNG)
-                response = requests.head(figure_url)
-                if response.status_code == 200 and "image/png" in response.headers.get(
-                    "Content-Type", ""
-                ):
-                    split_script[line_idx] = r"Figure: " + figure_url
-                else:
-                    # Remove "ar5iv.labs." and try again
-                    figure_url = figure_url.replace("ar5iv.labs.", "")
-                    response = requests.head(figure_url)
-                    if (
-                        response.status_code == 200
-                        and "image/png" in response.headers.get("Content-Type", "")
-                    ):
-                        split_script[line_idx] = r"Figure: " + figure_url
-            except requests.exceptions.RequestException:
-                # If the request fails, leave the link as is (or handle the error as you prefer)
-                pass
+            candidates.append((line_idx, figure_url))
+
+    if not candidates:
+        return "n".join(split_script)
+
+    # One session per call so all checks reuse the same TCP/TLS connections
+    with requests.Session() as session, ThreadPoolExecutor(
+        max_workers=min(_FIGURE_CHECK_WORKERS, len(candidates))
+    ) as executor:
+        results = executor.map(
+            lambda candidate: _resolve_figure_url(session, candidate[1]), candidates
+        )
+        for (line_idx, _), resolved_url in zip(candidates, results):
+            if resolved_url is not None:
+                split_script[line_idx] = r"Figure: " + resolved_url
 
     return "n".join(split_script)
 
 
+def _system_message(prompt: str, model: str) -> dict:
+    """Build the system message, marking it cacheable where the provider needs it.
+
+    OpenRouter only applies prompt caching to Anthropic models when the
+    content block carries an explicit cache_control marker; other providers
+    cache static prefixes automatically and get the plain string form.
+    """
+    if model.startswith("anthropic/"):
+        return {
+            "role": "system",
+            "content": [
+                {"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}
+            ],
+        }
+    return {"role": "system", "content": prompt}
+
+
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
+
+def _openrouter_mode(model: str):
+    return instructor.Mode.OPENROUTER_STRUCTURED_OUTPUTS if "gpt" not in model else instructor.Mode.JSON_SCHEMA
+
+
+def _openrouter_request_kwargs(paper: str, paper_id: str, model: str) -> dict:
+    """Build the chat completion arguments shared by the sync and batch paths."""
+    return dict(
+        model=model,
+        messages=
+        [
+            _system_message(
+                SYSTEM_PROMPT_NO_LINK if paper_id == "paper_id" else SYSTEM_PROMPT,
+                model,
+            ),
+            {
+                "role": "user",
+                "content": f"Here is the paper I want you to generate a script from, its paper_id is {paper_id} : "
+                + paper,
+            },
+        ],
+        response_model=ArxflixScript,
+        temperature=0.1,  # Slightly higher temperature to avoid getting stuck
+        max_retries=2,    # Reduced retries to fail faster
+        max_tokens=8000,
+    )
+
+
 def _process_script_openrouter(paper: str, paper_id: str) -> str:
     """Generate a video script using OpenRouter (OpenAI-compatible API).
 
     Uses the OpenAI SDK pointed to the OpenRouter base URL.
     """
-    OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
-    OPENROUTER_MODEL = os.getenv("SCRIPGENETOR_MODEL", "qwen/qwen3-235b-a22b-thinking-2507")
-    OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+    config = _cfg()
+    OPENROUTER_API_KEY = config.openrouter_api_key
+    OPENROUTER_MODEL = config.model
 
     if not OPENROUTER_API_KEY:
         raise ValueError("You need to set the OPENROUTER_API_KEY environment variable.")
 
+    # ArxflixScript validation checks the model output against this paper id
+    paper_id_token = _EXPECTED_PAPER_ID.set(paper_id)
     try:
         openrouter_client = instructor.from_openai(
             OpenAI(api_key=OPENROUTER_API_KEY, base_url=OPENROUTER_BASE_URL),
-            mode=instructor.Mode.OPENROUTER_STRUCTURED_OUTPUTS if "gpt" not in OPENROUTER_MODEL else instructor.Mode.JSON_SCHEMA,
+            mode=_openrouter_mode(OPENROUTER_MODEL),
             hooks=create_logging_hooks("openrouter"),
         )
         
-        # Try with reduced validation first
-        response,raw = openrouter_client.chat.completions.create_with_completion(
-            model=OPENROUTER_MODEL,
-            messages=
-            [
-                {"role": "system", "content": SYSTEM_PROMPT_NO_LINK if paper_id == "paper_id" else SYSTEM_PROMPT},
-                {
-                    "role": "user",
-                    "content": f"Here is the paper I want you to generate a script from, its paper_id is {paper_id} : "
-                    + paper,
-                },
-            ],
-            response_model=generate_model_with_context_check(paper_id, paper),
-            temperature=0.1,  # Slightly higher temperature to avoid getting stuck
-            max_retries=2,    # Reduced retries to fail faster
-            max_tokens=8000,
-        )
+        request_kwargs = _openrouter_request_kwargs(paper, paper_id, OPENROUTER_MODEL)
+
+        if config.streaming:
+            # Stream partial objects as the JSON arrives; instructor validates
+            # the final, complete object against ArxflixScript
+            response = None
+            for response in openrouter_client.chat.completions.create_partial(**request_kwargs):
+                logger.debug("Streaming script: %d components so far", len(response.components or []))
+        else:
+            # Try with reduced validation first
+            response,raw = openrouter_client.chat.completions.create_with_completion(**request_kwargs)
         
         if not response:
             raise ValueError("Empty response received from model")
@@ -640,23 +758,102 @@ def _process_script_openrouter(paper: str, paper_id: str) -> str:
         print(f"Error during script generation: {e}")
         # Try with a simpler prompt if the structured one fails
         raise ValueError(f"Script generation failed: {e}")
+    finally:
+        _EXPECTED_PAPER_ID.reset(paper_id_token)
 
     try:
         result = reconstruct_script(response)
     except Exception as e:
-        print(e)
-        raise ValueError(f"The model failed the script generation:  {e}, {traceback.format_exc()}")
+        # logger.exception only formats the traceback if a handler emits it
+        logger.exception("reconstruct failed: %s", e)
+        raise ValueError(f"The model failed the script generation: {e}") from e
     return result
 
 
 
-def process_script(method: Literal["openrouter"], paper_markdown: str, paper_id : str, from_pdf: bool=False) -> str:
+# Generated scripts keyed by _script_cache_key; mirrored to SCRIPT_CACHE_DIR if set
+# Most recently used scripts, capped at SCRIPT_CACHE_SIZE entries
+_SCRIPT_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_SCRIPT_CACHE_LOCK = threading.Lock()
+
+
+def _script_cache_key(method: str, paper: str, paper_id: str) -> str:
+    """Key on everything that determines the generated script."""
+    model = _cfg().model
+    paper_digest = hashlib.sha256(paper.encode("utf-8")).hexdigest()
+    return hashlib.blake2b(
+        "\0".join((paper_id, paper_digest, method, model)).encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+
+
+def _remember_script(key: str, script: str) -> None:
+    """Store a script in memory, evicting the least recently used ones."""
+    limit = _cfg().script_cache_size
+    with _SCRIPT_CACHE_LOCK:
+        _SCRIPT_CACHE[key] = script
+        _SCRIPT_CACHE.move_to_end(key)
+        while len(_SCRIPT_CACHE) > limit:
+            _SCRIPT_CACHE.popitem(last=False)
+
+
+def _get_cached_script(key: str) -> str | None:
+    with _SCRIPT_CACHE_LOCK:
+        script = _SCRIPT_CACHE.get(key)
+        if script is not None:
+            _SCRIPT_CACHE.move_to_end(key)
+            return script
+
+    cache_dir = _cfg().script_cache_dir
+    if not cache_dir:
+        return None
+    try:
+        with open(os.path.join(cache_dir, f"{key}.txt"), encoding="utf-8") as f:
+            script = f.read()
+    except OSError:
+        return None
+    _remember_script(key, script)
+    return script
+
+
+def _put_cached_script(key: str, script: str) -> None:
+    _remember_script(key, script)
+
+    cache_dir = _cfg().script_cache_dir
+    if not cache_dir:
+        return
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        path = os.path.join(cache_dir, f"{key}.txt")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(script)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write script cache entry {key}: {e}")
+
+
+def _prepare_paper(paper_markdown: str, paper_id: str, from_pdf: bool) -> tuple[str, str]:
+    """Fix figure links for HTML papers; PDF extractions skip the paper id check."""
+    if not from_pdf:
+        return adjust_links(paper_markdown , paper_id ), paper_id
+    return paper_markdown, "paper_id"
+
+
+def process_script(method: Literal["openrouter"], paper_markdown: str, paper_id : str, from_pdf: bool=False, refresh: bool=False) -> str:
     """Generate a video script for a research paper.
 
+    Scripts are cached per (paper_id, paper content, method, model) in memory,
+    keeping the SCRIPT_CACHE_SIZE most recent ones, and on disk when
+    SCRIPT_CACHE_DIR is set.
+
     Parameters
     ----------
     paper_markdown : str
         A research paper in markdown format.
+    refresh : bool
+        Skip the cache lookup and regenerate; the new script replaces the
+        cached one.
 
     Returns
     -------
@@ -668,24 +865,112 @@ def process_script(method: Literal["openrouter"], paper_markdown: str, paper_id
     ValueError
         If no result is returned from OpenAI.
     """
-    if not from_pdf:
-        pd_corrected_links = adjust_links(paper_markdown , paper_id )
-    else:
-        pd_corrected_links = paper_markdown
-        paper_id = "paper_id"
+    pd_corrected_links, paper_id = _prepare_paper(paper_markdown, paper_id, from_pdf)
+    cache_key = _script_cache_key(method, pd_corrected_links, paper_id)
+    cached = None if refresh else _get_cached_script(cache_key)
+    if cached is not None:
+        logger.info(f"Using cached script for paper_id: {paper_id}")
+        return cached
+
     if method == "openai":
-        return _process_script_gpt(pd_corrected_links,paper_id)
+        result = _process_script_gpt(pd_corrected_links,paper_id)
     elif method == "local":
-        return _process_script_open_source(pd_corrected_links, paper_id, end_point_base_url)
+        result = _process_script_open_source(pd_corrected_links, paper_id, end_point_base_url)
     elif method == "gemini":
-        return _process_script_open_gemini(pd_corrected_links, paper_id, end_point_base_url)
+        result = _process_script_open_gemini(pd_corrected_links, paper_id, end_point_base_url)
     elif method == "groq":
-        return _process_script_groq(pd_corrected_links,paper_id)
+        result = _process_script_groq(pd_corrected_links,paper_id)
     elif method == "openrouter":
-        return _process_script_openrouter(pd_corrected_links, paper_id)
+        result = _process_script_openrouter(pd_corrected_links, paper_id)
     else:
         raise ValueError(f"Invalid method '{method}'. Please choose 'openrouter', 'openai', 'gemini', 'groq', or 'local'.")
 
+    _put_cached_script(cache_key, result)
+    return result
+
+
+async def _process_script_openrouter_async(client, paper: str, paper_id: str, model: str) -> str:
+    """Async counterpart of _process_script_openrouter using a shared client."""
+    # Each gathered task runs in its own context copy, so this stays per paper
+    _EXPECTED_PAPER_ID.set(paper_id)
+    try:
+        response, raw = await client.chat.completions.create_with_completion(
+            **_openrouter_request_kwargs(paper, paper_id, model)
+        )
+        if not response:
+            raise ValueError("Empty response received from model")
+    except Exception as e:
+        raise ValueError(f"Script generation failed: {e}") from e
+
+    try:
+        return reconstruct_script(response)
+    except Exception as e:
+        logger.exception("reconstruct failed: %s", e)
+        raise ValueError(f"The model failed the script generation: {e}") from e
+
+
+async def process_scripts_batch(
+    papers: List[tuple[str, str]],
+    from_pdf: bool = False,
+    max_concurrency: int = 4,
+    refresh: bool = False,
+) -> List[str]:
+    """Generate scripts for several papers concurrently over one OpenRouter client.
+
+    Parameters
+    ----------
+    papers : list of (paper_markdown, paper_id)
+        The papers to generate scripts for.
+    from_pdf : bool
+        Whether the papers come from PDF extraction.
+    max_concurrency : int
+        Maximum number of requests in flight at once.
+    refresh : bool
+        Skip the script cache lookup and regenerate every paper.
+
+    Returns
+    -------
+    list of str
+        The generated scripts, in the same order as ``papers``.
+
+    Raises
+    ------
+    ValueError
+        If any script fails to generate.
+    """
+    from openai import AsyncOpenAI
+
+    config = _cfg()
+    if not config.openrouter_api_key:
+        raise ValueError("You need to set the OPENROUTER_API_KEY environment variable.")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def generate_one(client, paper_markdown: str, paper_id: str) -> str:
+        paper, paper_id = _prepare_paper(paper_markdown, paper_id, from_pdf)
+        cache_key = _script_cache_key("openrouter", paper, paper_id)
+        cached = None if refresh else _get_cached_script(cache_key)
+        if cached is not None:
+            return cached
+        async with semaphore:
+            result = await _process_script_openrouter_async(client, paper, paper_id, config.model)
+        _put_cached_script(cache_key, result)
+        return result
+
+    async with AsyncOpenAI(api_key=config.openrouter_api_key, base_url=OPENROUTER_BASE_URL) as raw:
+        client = instructor.from_openai(
+            raw,
+            mode=_openrouter_mode(config.model),
+            hooks=create_logging_hooks("openrouter-batch"),
+        )
+        # The task group cancels the remaining requests on the first failure
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(generate_one(client, md, pid)) for md, pid in papers]
+        except BaseExceptionGroup as eg:
+            raise eg.exceptions[0]
+
+    return [task.result() for task in tasks]
 
 def _fetch_paper_html(url):
     try:
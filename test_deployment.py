@@ -1,21 +1,41 @@
 #!/usr/bin/env python3
 """
 Test script for MCP server deployment readiness.
+
+Run directly for the deployment report, or collect with pytest.
 """
 
 import asyncio
+import functools
+import importlib
+import importlib.util
+import logging
 import sys
+import threading
+import time
 import os
+from pathlib import Path
+from typing import Final
+from unittest.mock import AsyncMock, patch
 
-# Add current directory to path to import main
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+try:
+    import pytest
+except ImportError:
+    # Only the pytest entry points need it; the report runs on the stdlib
+    pytest = None
 
-async def test_both_tools():
-    """Test both MCP tools together - full pipeline"""
-    try:
-        from main import generate_script_and_podcast
-        
-        sample_paper = """# Novel Neural Architecture for Text Processing
+logger = logging.getLogger(__name__)
+
+# Import the server once for the whole run; tests report the failure
+try:
+    from main import generate_script_and_podcast, mcp
+    _MAIN_OK = True
+    _MAIN_IMPORT_ERROR = None
+except ImportError as e:
+    _MAIN_OK = False
+    _MAIN_IMPORT_ERROR = e
+
+_SAMPLE_PAPER: Final[str] = """# Novel Neural Architecture for Text Processing
 
 ## Abstract
 This paper introduces a breakthrough approach to neural text processing that achieves 
@@ -43,142 +63,313 @@ This work demonstrates that architectural innovations can lead to substantial im
 in both performance and efficiency. The proposed method opens new avenues for research
 in efficient neural architectures.
 """
-        
-        print("🧪 Testing full pipeline (script + podcast generation)...")
-        result = await generate_script_and_podcast(
-            paper_markdown=sample_paper,
-            paper_id="test.deployment",
-            output_filename="deployment_test_podcast.wav",
+
+def probe(name):
+    """
+    Turn a check coroutine into a timed deployment probe.
+
+    The wrapped coroutine never raises on a failed check; it prints the
+    error and returns ``(name, ok, elapsed_seconds)``.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                ok = bool(await fn(*args, **kwargs))
+            except Exception as e:
+                ok = False
+                print(f"❌ {name} failed: {e}")
+                # Tracebacks are opt-in so the report stays short
+                if os.environ.get("VERBOSE"):
+                    logger.exception(f"{name} check failed")
+            return name, ok, time.perf_counter() - start
+        wrapper.probe_name = name
+        return wrapper
+    return decorator
+
+# Cap on pipelines running at once when several papers are checked
+_PIPELINE_CONCURRENCY = 8
+
+def _bounded_as_completed(coros, limit):
+    """Like asyncio.as_completed, but with at most ``limit`` coroutines running"""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return asyncio.as_completed([run(c) for c in coros])
+
+@probe("Full Pipeline")
+async def check_both_tools(papers=(_SAMPLE_PAPER,), output_dir="."):
+    """Test both MCP tools together - full pipeline"""
+    if not _MAIN_OK:
+        print(f"❌ Could not import main: {_MAIN_IMPORT_ERROR}")
+        return False
+    print("🧪 Testing full pipeline (script + podcast generation)...")
+    coros = (
+        generate_script_and_podcast(
+            paper_markdown=paper,
+            paper_id="test.deployment" if i == 0 else f"test.deployment.{i}",
+            output_filename=os.path.join(
+                output_dir,
+                "deployment_test_podcast.wav" if i == 0
+                else f"deployment_test_podcast_{i}.wav",
+            ),
             tts_engine="mock"  # Use mock for testing
         )
-        
-        print("✅ Full pipeline test completed!")
+        for i, paper in enumerate(papers)
+    )
+    for fut in _bounded_as_completed(coros, _PIPELINE_CONCURRENCY):
+        result = await fut
         print(f"Result:\n{result}")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    
+    print("✅ Full pipeline test completed!")
+    return True
 
-async def test_server_structure():
+# Tools main.py must register for the deployment to be usable
+_EXPECTED_TOOLS: Final[frozenset] = frozenset({
+    "generate_script",
+    "generate_podcast",
+    "generate_script_and_podcast",
+})
+
+@probe("Server Structure")
+async def check_server_structure():
     """Test MCP server structure and tools registration"""
-    try:
-        from main import mcp
-        
-        print("🔍 Checking MCP server structure...")
-        
-        # Test server info
-        print(f"📊 Server name: Podcaster MCP Server")
-        print(f"🔧 Available methods: {len([attr for attr in dir(mcp) if not attr.startswith('_')])}")
-        
-        # Check specific methods exist
-        required_methods = ['add_tool', 'tool', 'run']
-        for method in required_methods:
-            if not hasattr(mcp, method):
-                print(f"❌ Missing required method: {method}")
-                return False
-            print(f"✅ Has method: {method}")
-        
-        print("✅ MCP server structure is valid!")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Server structure test failed: {e}")
+    if not _MAIN_OK:
+        print(f"❌ Could not import main: {_MAIN_IMPORT_ERROR}")
+        return False
+    print("🔍 Checking MCP server structure...")
+    
+    # Test server info
+    print(f"📊 Server name: {mcp.name}")
+    
+    # Check the tools are actually registered, straight from FastMCP's
+    # registry rather than scanning the server's attributes
+    registered = set(mcp._tool_manager._tools)
+    print(f"🔧 Registered tools: {len(registered)}")
+    missing = _EXPECTED_TOOLS - registered
+    if missing:
+        print(f"❌ Missing tools: {', '.join(sorted(missing))}")
         return False
+    for tool_name in sorted(_EXPECTED_TOOLS):
+        print(f"✅ Has tool: {tool_name}")
+    
+    print("✅ MCP server structure is valid!")
+    return True
+
+def _module_available(module_name):
+    """Check that a module can be imported without executing it"""
+    return importlib.util.find_spec(module_name) is not None
 
-async def test_environment_setup():
+@functools.lru_cache(maxsize=1)
+def _env_present(cwd):
+    """Whether a .env file exists in ``cwd``; keyed on it so a chdir re-checks"""
+    return Path(cwd, '.env').is_file()
+
+@probe("Environment Setup")
+async def check_environment_setup():
     """Test environment and dependencies"""
-    try:
-        print("🔍 Checking environment setup...")
-        
-        # Test imports
-        required_imports = [
-            'generate_podcast',
-            'soundfile',
-            'numpy', 
-            'elevenlabs',
-            'dotenv'
-        ]
-        
-        for module_name in required_imports:
-            try:
-                if module_name == 'generate_podcast':
-                    from generate_podcast import PodcastGenerator, PodcastConfig
-                    print(f"✅ {module_name} imported successfully")
-                elif module_name == 'soundfile':
-                    import soundfile as sf
-                    print(f"✅ {module_name} imported successfully")
-                elif module_name == 'numpy':
-                    import numpy as np
-                    print(f"✅ {module_name} imported successfully")
-                elif module_name == 'elevenlabs':
-                    from elevenlabs import ElevenLabs
-                    print(f"✅ {module_name} imported successfully")
-                elif module_name == 'dotenv':
-                    from dotenv import load_dotenv
-                    print(f"✅ {module_name} imported successfully")
-            except ImportError as e:
-                print(f"⚠️  {module_name} import warning: {e}")
-        
-        # Check .env file
-        if os.path.exists('.env'):
-            print("✅ .env file exists")
+    print("🔍 Checking environment setup...")
+    
+    # Test imports; find_spec only locates the modules, so the probe
+    # doesn't pay for loading numpy/soundfile/elevenlabs
+    required_imports = [
+        'generate_podcast',
+        'soundfile',
+        'numpy', 
+        'elevenlabs',
+        'dotenv'
+    ]
+    
+    for module_name in required_imports:
+        if _module_available(module_name):
+            print(f"✅ {module_name} found")
         else:
-            print("⚠️  .env file not found (API keys may not be available)")
-        
-        print("✅ Environment setup looks good!")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Environment test failed: {e}")
-        return False
+            print(f"⚠️  {module_name} import warning: module not found")
+    
+    # Exercising the podcast API means a real import; opt in explicitly
+    if os.environ.get("PODCAST_FULL_PROBE") == "1":
+        try:
+            await asyncio.to_thread(
+                importlib.import_module, "generate_podcast"
+            )
+            print("✅ generate_podcast imported successfully")
+        except ImportError as e:
+            print(f"⚠️  generate_podcast import warning: {e}")
+    
+    # Check .env file
+    if _env_present(os.getcwd()):
+        print("✅ .env file exists")
+    else:
+        print("⚠️  .env file not found (API keys may not be available)")
+    
+    print("✅ Environment setup looks good!")
+    return True
+
+if pytest is not None:
+    @pytest.fixture(scope="session")
+    def sample_paper():
+        return _SAMPLE_PAPER
+
+    @pytest.fixture(scope="session")
+    def papers(sample_paper):
+        return [sample_paper]
+
+    @pytest.mark.asyncio
+    async def test_environment_setup():
+        _, ok, _ = await check_environment_setup()
+        assert ok
+
+    @pytest.mark.asyncio
+    async def test_server_structure(mcp_module):
+        _, ok, _ = await check_server_structure()
+        assert ok
+
+    @pytest.mark.asyncio
+    async def test_both_tools(mcp_module, papers, tmp_path):
+        # Stub out the OpenRouter step; the podcast half still runs on mock TTS
+        script = "\\Headline: Test headline\n\\Text: Test body text."
+        with patch.object(
+            mcp_module, "generate_script", new=AsyncMock(return_value=script)
+        ) as generate_script:
+            _, ok, _ = await check_both_tools(papers, output_dir=str(tmp_path))
+        assert ok
+        assert generate_script.await_count == len(papers)
+
+# Upper bound for the whole deployment run; generating a real script can
+# take minutes, so this is deliberately generous and overridable
+_SUITE_TIMEOUT = float(os.environ.get("DEPLOYMENT_TEST_TIMEOUT", "600"))
+
+class _ProbeFailed(Exception):
+    """Raised by a failed probe so the task group cancels its siblings"""
+
+    def __init__(self, name, elapsed):
+        super().__init__(name)
+        self.name = name
+        self.elapsed = elapsed
+
+async def _fail_fast(fn):
+    """Await a probe and turn a reported failure into :class:`_ProbeFailed`"""
+    name, ok, elapsed = await fn()
+    if not ok:
+        raise _ProbeFailed(name, elapsed)
+    return name, ok, elapsed
+
+async def _in_daemon_thread(fn):
+    """Run the async ``fn`` on its own loop in a daemon thread.
+
+    The pipeline makes blocking API calls, which would stall this loop and
+    keep both the timeout and sibling cancellation from firing. Awaiting it
+    from a thread keeps the loop responsive; a daemon thread is abandoned on
+    exit, so a hung call cannot hold up the interpreter.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(setter, value):
+        if not future.done():
+            setter(value)
+
+    def target():
+        try:
+            result = asyncio.run(fn())
+        except BaseException as e:
+            loop.call_soon_threadsafe(settle, future.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(settle, future.set_result, result)
+
+    threading.Thread(target=target, name=fn.probe_name, daemon=True).start()
+    return await future
+
+def _task_outcome(task):
+    """``(ok, elapsed_seconds)`` for a probe task; elapsed is None if it never finished"""
+    if task is None or not task.done() or task.cancelled():
+        return False, None
+    exc = task.exception()
+    if isinstance(exc, _ProbeFailed):
+        return False, exc.elapsed
+    if exc is not None:
+        return False, None
+    _, ok, elapsed = task.result()
+    return ok, elapsed
 
 async def main():
     """Run all deployment tests"""
-    print("🚀 Starting MCP server deployment tests...\n")
-    
-    tests = [
-        ("Environment Setup", test_environment_setup()),
-        ("Server Structure", test_server_structure()),
-        ("Full Pipeline", test_both_tools()),
+    named = [
+        (check_environment_setup.probe_name, check_environment_setup),
+        (check_server_structure.probe_name, check_server_structure),
+        (check_both_tools.probe_name, functools.partial(_in_daemon_thread, check_both_tools)),
     ]
     
-    results = []
-    for test_name, test_coro in tests:
-        print("=" * 60)
-        print(f"📋 Running: {test_name}")
-        print("=" * 60)
-        success = await test_coro
-        results.append((test_name, success))
-        print()
+    # Report lines are collected and written in one go, so the runner
+    # doesn't block the event loop on a slow stdout between probes
+    out = ["🚀 Starting MCP server deployment tests...\n", "=" * 60]
+    out.extend(f"📋 Running: {test_name}" for test_name, _ in named)
+    out.append("=" * 60)
+    sys.stdout.write("\n".join(out) + "\n")
+    
+    # The probes are independent, so run them together in a task group.
+    # A failed probe raises _ProbeFailed, which makes the group cancel the
+    # others (a long pipeline run is pointless once setup is broken); the
+    # pipeline runs in a thread, so neither that nor the timeout waits on it.
+    tasks = {}
+    try:
+        async with asyncio.timeout(_SUITE_TIMEOUT):
+            async with asyncio.TaskGroup() as tg:
+                for test_name, fn in named:
+                    tasks[test_name] = tg.create_task(_fail_fast(fn), name=test_name)
+    except* TimeoutError:
+        print(f"❌ Deployment tests timed out after {_SUITE_TIMEOUT:.0f}s")
+    except* _ProbeFailed:
+        # Each probe already printed its own failure
+        pass
+    except* Exception as eg:
+        for exc in eg.exceptions:
+            print(f"❌ Test crashed: {exc!r}")
+    results = [
+        (test_name, *_task_outcome(tasks.get(test_name)))
+        for test_name, _ in named
+    ]
     
     # Summary
-    print("=" * 60)
-    print("📊 Deployment Test Summary:")
-    print("=" * 60)
+    out = ["", "=" * 60, "📊 Deployment Test Summary:", "=" * 60]
     all_passed = True
-    for test_name, success in results:
+    for test_name, success, elapsed in results:
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"  {test_name}: {status}")
+        if elapsed is not None:
+            timing = f"{elapsed:.2f}s"
+        elif tasks.get(test_name) is not None and tasks[test_name].cancelled():
+            timing = "cancelled"
+        else:
+            timing = "n/a"
+        out.append(f"  {test_name}: {status} ({timing})")
         if not success:
             all_passed = False
+    timed = [(elapsed, test_name) for test_name, _, elapsed in results if elapsed is not None]
+    if timed:
+        slowest_elapsed, slowest_name = max(timed)
+        out.append(f"  ⏱️  Slowest probe: {slowest_name} ({slowest_elapsed:.2f}s)")
     
-    print()
+    out.append("")
     if all_passed:
-        print("🎉 All tests passed! MCP server is ready for deployment on Alpic!")
-        print()
-        print("📝 Deployment Instructions:")
-        print("  1. Ensure all dependencies are installed: uv sync")
-        print("  2. Set environment variables in .env file")
-        print("  3. Deploy main.py as MCP server")
-        print("  4. Available tools:")
-        print("     • generate_script: Generate video script from research paper")
-        print("     • generate_podcast: Convert script to audio podcast") 
-        print("     • generate_script_and_podcast: Full pipeline")
+        out += [
+            "🎉 All tests passed! MCP server is ready for deployment on Alpic!",
+            "",
+            "📝 Deployment Instructions:",
+            "  1. Ensure all dependencies are installed: uv sync",
+            "  2. Set environment variables in .env file",
+            "  3. Deploy main.py as MCP server",
+            "  4. Available tools:",
+            "     • generate_script: Generate video script from research paper",
+            "     • generate_podcast: Convert script to audio podcast",
+            "     • generate_script_and_podcast: Full pipeline",
+        ]
     else:
-        print("⚠️  Some tests failed. Please fix issues before deployment.")
+        out.append("⚠️  Some tests failed. Please fix issues before deployment.")
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+Tests for the script cache in generate_script.
+
+The OpenRouter call is stubbed out, so these run offline.
+"""
+
+import pytest
+
+import generate_script
+
+
+@pytest.fixture
+def generated(monkeypatch):
+    """Stub script generation and reset the cache; returns the list of generated paper ids."""
+    calls = []
+
+    def fake_openrouter(paper, paper_id):
+        calls.append(paper_id)
+        return f"script for {paper_id} #{len(calls)}"
+
+    monkeypatch.setattr(generate_script, "_process_script_openrouter", fake_openrouter)
+    monkeypatch.setattr(generate_script, "adjust_links", lambda text_md, paper_id: text_md)
+    monkeypatch.setenv("SCRIPT_CACHE_DIR", "")
+    monkeypatch.setenv("SCRIPT_CACHE_SIZE", "2")
+    generate_script._cfg.cache_clear()
+    generate_script._SCRIPT_CACHE.clear()
+    yield calls
+    generate_script._cfg.cache_clear()
+    generate_script._SCRIPT_CACHE.clear()
+
+
+def _script(paper_id, **kwargs):
+    return generate_script.process_script("openrouter", f"# Paper {paper_id}", paper_id, **kwargs)
+
+
+def test_repeat_call_is_cached(generated):
+    first = _script("1")
+    assert _script("1") == first
+    assert generated == ["1"]
+
+
+def test_lru_eviction(generated):
+    _script("1")
+    _script("2")
+    _script("1")  # refresh 1, so 2 is now the least recently used
+    _script("3")
+    assert len(generate_script._SCRIPT_CACHE) == 2
+
+    _script("1")
+    assert generated == ["1", "2", "3"]
+    _script("2")
+    assert generated == ["1", "2", "3", "2"]
+
+
+def test_refresh_regenerates_and_replaces(generated):
+    first = _script("1")
+    refreshed = _script("1", refresh=True)
+    assert refreshed != first
+    assert _script("1") == refreshed
+    assert generated == ["1", "1"]
+
+
+def test_negative_cache_size_disables_memory_cache(generated, monkeypatch):
+    monkeypatch.setenv("SCRIPT_CACHE_SIZE", "-1")
+    generate_script._cfg.cache_clear()
+    _script("1")
+    _script("1")
+    assert not generate_script._SCRIPT_CACHE
+    assert generated == ["1", "1"]
+
+
+def test_cache_dir_mirroring(generated, monkeypatch, tmp_path):
+    monkeypatch.setenv("SCRIPT_CACHE_DIR", str(tmp_path))
+    generate_script._cfg.cache_clear()
+    first = _script("1")
+    files = list(tmp_path.glob("*.txt"))
+    assert [f.read_text(encoding="utf-8") for f in files] == [first]
+
+    # A fresh process only has the disk copy
+    generate_script._SCRIPT_CACHE.clear()
+    assert _script("1") == first
+    assert generated == ["1"]
@@ -1,30 +1,68 @@
 #!/usr/bin/env python3
 """
 Test script to verify MCP tools are working properly.
+
+Run directly for the summary report, or collect with pytest.
 """
 
 import asyncio
-import sys
+import functools
+import logging
 import os
+from typing import Final
+from unittest.mock import patch
 
-# Add current directory to path to import main
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+try:
+    import pytest
+except ImportError:
+    # Only the pytest entry points need it; the report runs on the stdlib
+    pytest = None
 
-async def test_podcast_generation():
-    """Test the podcast generation MCP tool"""
-    try:
-        from main import generate_podcast
-        
-        # Sample script text for testing
-        sample_script = """\\Headline: Let's explore the world of artificial intelligence
+logger = logging.getLogger(__name__)
+
+# Import the server once for the whole run; tests report the failure
+try:
+    from main import generate_podcast, generate_script
+    _MAIN_OK = True
+    _MAIN_IMPORT_ERROR = None
+except ImportError as e:
+    _MAIN_OK = False
+    _MAIN_IMPORT_ERROR = e
+
+# Sample script text for testing
+_SAMPLE_SCRIPT: Final[str] = """\\Headline: Let's explore the world of artificial intelligence
 \\Text: Welcome to this podcast about AI research! Today we're going to discuss some fascinating developments in the field.
 \\Headline: Now let's look at the key findings
 \\Text: The research shows that these new methods can significantly improve performance across various tasks."""
-        
+
+_SAMPLE_PAPER: Final[str] = """# Sample Research Paper
+
+## Abstract
+This paper presents a novel approach to neural networks that improves performance by 15%.
+
+## Introduction
+Recent advances in deep learning have shown promising results...
+
+## Methods
+We propose a new architecture that combines attention mechanisms with...
+
+## Results  
+Our experiments show significant improvements over baseline methods...
+
+## Conclusion
+This work demonstrates the effectiveness of our proposed approach...
+"""
+
+async def check_podcast_generation(script=_SAMPLE_SCRIPT, output_dir="."):
+    """Test the podcast generation MCP tool"""
+    if not _MAIN_OK:
+        print(f"❌ Could not import main: {_MAIN_IMPORT_ERROR}")
+        return False
+    try:
         print("🧪 Testing podcast generation MCP tool...")
         result = await generate_podcast(
-            script_text=sample_script,
-            output_filename="test_mcp_podcast.wav",
+            script_text=script,
+            output_filename=os.path.join(output_dir, "test_mcp_podcast.wav"),
             tts_engine="mock"  # Use mock to avoid API calls
         )
         
@@ -34,36 +72,20 @@ async def test_podcast_generation():
         
     except Exception as e:
         print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        # Tracebacks are opt-in so the report stays short
+        if os.environ.get("VERBOSE"):
+            logger.exception("Podcast generation check failed")
         return False
 
-async def test_script_generation():
+async def check_script_generation(paper=_SAMPLE_PAPER):
     """Test the script generation MCP tool"""
+    if not _MAIN_OK:
+        print(f"❌ Could not import main: {_MAIN_IMPORT_ERROR}")
+        return False
     try:
-        from main import generate_script
-        
-        sample_paper = """# Sample Research Paper
-        
-        ## Abstract
-        This paper presents a novel approach to neural networks that improves performance by 15%.
-        
-        ## Introduction
-        Recent advances in deep learning have shown promising results...
-        
-        ## Methods
-        We propose a new architecture that combines attention mechanisms with...
-        
-        ## Results  
-        Our experiments show significant improvements over baseline methods...
-        
-        ## Conclusion
-        This work demonstrates the effectiveness of our proposed approach...
-        """
-        
         print("🧪 Testing script generation MCP tool...")
         result = await generate_script(
-            paper_markdown=sample_paper,
+            paper_markdown=paper,
             paper_id="test.paper",
             method="openrouter"
         )
@@ -77,18 +99,71 @@ async def test_script_generation():
         print("Note: This may fail without proper API keys, which is expected")
         return False
 
+if pytest is not None:
+    @pytest.fixture(scope="session")
+    def sample_script():
+        return _SAMPLE_SCRIPT
+
+    @pytest.fixture(scope="session")
+    def sample_paper():
+        return _SAMPLE_PAPER
+
+    @pytest.mark.asyncio
+    async def test_podcast_generation(mcp_module, sample_script, tmp_path):
+        assert await check_podcast_generation(sample_script, output_dir=str(tmp_path))
+
+    @pytest.mark.asyncio
+    async def test_podcast_generator_tts_fn(sample_script, tmp_path):
+        generate_podcast_module = pytest.importorskip("generate_podcast")
+        sample_rate = 16000
+        config = generate_podcast_module.PodcastConfig(
+            sample_rate=sample_rate,
+            tts_fn=functools.partial(
+                generate_podcast_module.mock_tts, sample_rate=sample_rate
+            ),
+        )
+        generator = generate_podcast_module.PodcastGenerator(config)
+        # Audio already at the configured rate must not be resampled
+        with patch.object(
+            generator, "_resample_audio", side_effect=AssertionError("resampled")
+        ):
+            output_path = await generator.generate_podcast(
+                sample_script, str(tmp_path / "tts_fn_podcast.wav")
+            )
+        assert os.path.isfile(output_path)
+        assert generator.elevenlabs is None and not generator._tts_initialized
+
+    @pytest.mark.asyncio
+    async def test_script_generation(mcp_module, sample_paper, sample_script):
+        # The tool's own argument handling runs; OpenRouter is never called
+        with patch(
+            "generate_script.process_script", return_value=sample_script
+        ) as process_script:
+            result = await mcp_module.generate_script(
+                paper_markdown=sample_paper,
+                paper_id="test.paper",
+                method="openrouter",
+            )
+        assert result == sample_script
+        process_script.assert_called_once_with(
+            method="openrouter",
+            paper_markdown=sample_paper,
+            paper_id="test.paper",
+            from_pdf=False,
+        )
+
 async def main():
     """Run all tests"""
     print("🚀 Starting MCP tools test suite...\n")
     
     # Test 1: Podcast generation (should work with mock engine)
     print("=" * 50)
-    success1 = await test_podcast_generation()
+    success1 = await check_podcast_generation()
     print()
     
     # Test 2: Script generation (may fail without API keys) 
     print("=" * 50)
-    success2 = await test_script_generation()
+    success2 = await check_script_generation()
     print()
     
     # Summary